@@ -5,9 +5,15 @@ def print_context_menu(debugger, command, exe_ctx, result, internal_dict):
     frame = exe_ctx.GetFrame()
     node_val = frame.FindVariable("node")
     if node_val and node_val.GetValueAsUnsigned() != 0:
-        node_id = frame.EvaluateExpression("node->getId().toString().toUtf8().constData()")
-        node_type = frame.EvaluateExpression("node->getNodeType().toUtf8().constData()")
-        result.PutCString(f"[LLDB] Context menu for node id={node_id.GetSummary()} type={node_type.GetSummary()}")
+        # one expression per hit: the parser/JIT dominates, so fetch "id|type" together
+        node_info = frame.EvaluateExpression(
+            'node->getId().toString().append(QString("|")).append(node->getNodeType()).toUtf8().constData()'
+        )
+        if not node_info.GetError().Success():
+            result.PutCString(f"[LLDB] Context menu for node (expression failed: {node_info.GetError().GetCString()})")
+            return 0
+        node_id, _, node_type = (node_info.GetSummary() or "").strip('"').partition("|")
+        result.PutCString(f"[LLDB] Context menu for node id={node_id} type={node_type}")
     else:
         result.PutCString("[LLDB] Context menu invoked (background / no node)")
     return 0
@@ -10,18 +10,23 @@ Usage examples:
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 import uuid
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple
+from xml.sax.saxutils import escape
 
 
 @dataclass
 class Node:
     """Represents a serialized node entry."""
 
+    # Must list exactly the annotated fields below; fields cannot take
+    # defaults while __slots__ is declared by hand.
+    __slots__ = ("id", "type", "x", "y", "inputs", "outputs")
+
     id: str
     type: str
     x: float
@@ -34,6 +39,10 @@ class Node:
 class Edge:
     """Represents a serialized edge entry."""
 
+    # Must list exactly the annotated fields below; fields cannot take
+    # defaults while __slots__ is declared by hand.
+    __slots__ = ("id", "from_node", "to_node", "from_socket", "to_socket")
+
     id: str
     from_node: Node
     to_node: Node
@@ -41,8 +50,42 @@ class Edge:
     to_socket: int
 
 
-def _new_id() -> str:
-    return str(uuid.uuid4())
+def _new_ids(count: int) -> List[str]:
+    """
+    Return ``count`` random UUID4 strings drawn from a single os.urandom call.
+    """
+    raw = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=raw[offset : offset + 16], version=4))
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
+class _IdPool:
+    """
+    Hands out a builder's pre-drawn ids in order.
+
+    The pool size must match the shape being built: drawing past the end or
+    leaving ids unused raises instead of failing silently.
+    """
+
+    __slots__ = ("_ids", "_used")
+
+    def __init__(self, count: int) -> None:
+        self._ids = _new_ids(count)
+        self._used = 0
+
+    def take(self) -> str:
+        if self._used >= len(self._ids):
+            raise RuntimeError(f"graph builder needs more than {len(self._ids)} pre-drawn ids")
+        self._used += 1
+        return self._ids[self._used - 1]
+
+    def close(self) -> None:
+        if self._used != len(self._ids):
+            raise RuntimeError(
+                f"graph builder used {self._used} of {len(self._ids)} pre-drawn ids"
+            )
 
 
 def build_pipeline(stages: int, spacing: int) -> Tuple[List[Node], List[Edge]]:
@@ -54,23 +97,26 @@ def build_pipeline(stages: int, spacing: int) -> Tuple[List[Node], List[Edge]]:
 
     nodes: List[Node] = []
     edges: List[Edge] = []
+    # stages + 2 nodes (SOURCE, TRANSFORM x stages, SINK) + stages + 1 edges
+    ids = _IdPool(2 * stages + 3)
 
     x = 0
-    source = Node(_new_id(), "SOURCE", x, 0, inputs=0, outputs=1)
+    source = Node(ids.take(), "SOURCE", x, 0, inputs=0, outputs=1)
     nodes.append(source)
 
     prev = source
     for _ in range(stages):
         x += spacing
-        stage = Node(_new_id(), "TRANSFORM", x, 0, inputs=1, outputs=1)
+        stage = Node(ids.take(), "TRANSFORM", x, 0, inputs=1, outputs=1)
         nodes.append(stage)
-        edges.append(Edge(_new_id(), prev, stage, from_socket=0, to_socket=0))
+        edges.append(Edge(ids.take(), prev, stage, from_socket=0, to_socket=0))
         prev = stage
 
     x += spacing
-    sink = Node(_new_id(), "SINK", x, 0, inputs=1, outputs=0)
+    sink = Node(ids.take(), "SINK", x, 0, inputs=1, outputs=0)
     nodes.append(sink)
-    edges.append(Edge(_new_id(), prev, sink, from_socket=0, to_socket=0))
+    edges.append(Edge(ids.take(), prev, sink, from_socket=0, to_socket=0))
+    ids.close()
 
     return nodes, edges
 
@@ -81,63 +127,75 @@ def build_split_merge(spacing: int) -> Tuple[List[Node], List[Edge]]:
     """
     nodes: List[Node] = []
     edges: List[Edge] = []
+    # 6 nodes + 6 edges, matching the fixed shape built below
+    ids = _IdPool(12)
 
-    source = Node(_new_id(), "SOURCE", 0, 0, 0, 1)
-    split = Node(_new_id(), "SPLIT", spacing, 0, 1, 2)
-    upper = Node(_new_id(), "TRANSFORM", spacing * 2, -spacing, 1, 1)
-    lower = Node(_new_id(), "TRANSFORM", spacing * 2, spacing, 1, 1)
-    merge = Node(_new_id(), "MERGE", spacing * 3, 0, 2, 1)
-    sink = Node(_new_id(), "SINK", spacing * 4, 0, 1, 0)
+    source = Node(ids.take(), "SOURCE", 0, 0, 0, 1)
+    split = Node(ids.take(), "SPLIT", spacing, 0, 1, 2)
+    upper = Node(ids.take(), "TRANSFORM", spacing * 2, -spacing, 1, 1)
+    lower = Node(ids.take(), "TRANSFORM", spacing * 2, spacing, 1, 1)
+    merge = Node(ids.take(), "MERGE", spacing * 3, 0, 2, 1)
+    sink = Node(ids.take(), "SINK", spacing * 4, 0, 1, 0)
 
     nodes.extend([source, split, upper, lower, merge, sink])
 
     edges.extend(
         [
-            Edge(_new_id(), source, split, 0, 0),
-            Edge(_new_id(), split, upper, 1, 0),
-            Edge(_new_id(), split, lower, 2, 0),
-            Edge(_new_id(), upper, merge, 0, 0),
-            Edge(_new_id(), lower, merge, 0, 1),
-            Edge(_new_id(), merge, sink, 0, 0),
+            Edge(ids.take(), source, split, 0, 0),
+            Edge(ids.take(), split, upper, 1, 0),
+            Edge(ids.take(), split, lower, 2, 0),
+            Edge(ids.take(), upper, merge, 0, 0),
+            Edge(ids.take(), lower, merge, 0, 1),
+            Edge(ids.take(), merge, sink, 0, 0),
         ]
     )
+    ids.close()
 
     return nodes, edges
 
 
+# Whitespace is encoded too so values survive attribute normalization on load.
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+
+def _xml_attr(value: str) -> str:
+    """Escape a free-text attribute value; plain names take the fast path."""
+    if any(ch in value for ch in '&<>"\n\r\t'):
+        return escape(value, _ATTR_ENTITIES)
+    return value
+
+
 def write_graph(nodes: List[Node], edges: List[Edge], path: Path) -> None:
-    root = ET.Element("graph", attrib={"version": "1.0"})
-
-    for node in nodes:
-        ET.SubElement(
-            root,
-            "node",
-            attrib={
-                "id": node.id,
-                "x": f"{int(node.x)}",
-                "y": f"{int(node.y)}",
-                "type": node.type,
-                "inputs": str(node.inputs),
-                "outputs": str(node.outputs),
-            },
-        )
-
-    for edge in edges:
-        ET.SubElement(
-            root,
-            "edge",
-            attrib={
-                "id": edge.id,
-                "fromNode": edge.from_node.id,
-                "toNode": edge.to_node.id,
-                "fromSocketIndex": str(edge.from_socket),
-                "toSocketIndex": str(edge.to_socket),
-            },
-        )
-
-    tree = ET.ElementTree(root)
+    """
+    Stream the graph straight to disk instead of building an ElementTree.
+
+    Ids and numeric fields never need XML escaping; node types go through
+    _xml_attr so they read back unchanged, as they did with ElementTree.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    tree.write(path, encoding="utf-8", xml_declaration=True)
+
+    with path.open("wb", buffering=1 << 16) as out:
+        write = out.write
+        write(b'<?xml version="1.0" encoding="utf-8"?>\n<graph version="1.0">\n')
+
+        for node in nodes:
+            write(
+                (
+                    f'  <node id="{node.id}" x="{int(node.x)}" y="{int(node.y)}" '
+                    f'type="{_xml_attr(node.type)}" inputs="{node.inputs}" outputs="{node.outputs}"/>\n'
+                ).encode("utf-8")
+            )
+
+        for edge in edges:
+            write(
+                (
+                    f'  <edge id="{edge.id}" fromNode="{edge.from_node.id}" '
+                    f'toNode="{edge.to_node.id}" fromSocketIndex="{edge.from_socket}" '
+                    f'toSocketIndex="{edge.to_socket}"/>\n'
+                ).encode("utf-8")
+            )
+
+        write(b"</graph>\n")
 
 
 def parse_args(argv: List[str]) -> argparse.Namespace: